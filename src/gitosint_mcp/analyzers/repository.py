@@ -10,11 +10,12 @@ formatting results for consumption by AI assistants.
 
 import asyncio
 import aiohttp
+import functools
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from urllib.parse import urlparse
-from ..config import MCPConfig as Config
+from ..config import MCPConfig as Config, SUPPORTED_PLATFORMS
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +65,29 @@ class ContributorInfo:
     def max_contributors_per_repo(self, value):
         raise NotImplementedError
 
+@functools.lru_cache(maxsize=1024)
+def _parse_url_cached(url: str) -> tuple[str, str, str]:
+    """Parse repository URL into (platform, owner, repo), memoized per URL."""
+    parsed = urlparse(url)
+    domain = parsed.netloc.lower()
+    
+    # Remove www. prefix if present
+    if domain.startswith('www.'):
+        domain = domain[4:]
+    
+    path_parts = parsed.path.strip('/').split('/')
+    if len(path_parts) < 2:
+        raise ValueError(f"Invalid repository URL format: {url}")
+    
+    owner, repo_name = path_parts[0], path_parts[1]
+    if repo_name.endswith('.git'):
+        repo_name = repo_name[:-4]
+    
+    if domain not in SUPPORTED_PLATFORMS:
+        raise ValueError(f"Unsupported platform: {domain}")
+    
+    return domain, owner, repo_name
+
 class RepositoryAnalyzer:
     """
     Repository Analyzer for GitOSINT-MCP Addon
@@ -82,10 +106,10 @@ class RepositoryAnalyzer:
         """Initialize repository analyzer for MCP addon."""
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
+        # One parser per supported platform, e.g. github.com -> _parse_github_url
         self._platform_parsers = {
-            'github.com': self._parse_github_url,
-            'gitlab.com': self._parse_gitlab_url,
-            'bitbucket.org': self._parse_bitbucket_url
+            domain: getattr(self, f"_parse_{domain.split('.')[0]}_url")
+            for domain in SUPPORTED_PLATFORMS
         }
     
     async def __aenter__(self):
@@ -184,31 +208,7 @@ class RepositoryAnalyzer:
     
     def _parse_repository_url(self, url: str) -> tuple[str, str, str]:
         """Parse repository URL for MCP addon processing."""
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        
-        # Remove www. prefix if present
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
-        # Parse path to extract owner and repository
-        path_parts = parsed.path.strip('/').split('/')
-        
-        if len(path_parts) < 2:
-            raise ValueError(f"Invalid repository URL format: {url}")
-        
-        owner = path_parts[0]
-        repo_name = path_parts[1]
-        
-        # Remove .git suffix if present
-        if repo_name.endswith('.git'):
-            repo_name = repo_name[:-4]
-        
-        # Validate platform support for MCP addon
-        if domain not in self._platform_parsers:
-            raise ValueError(f"Unsupported platform: {domain}")
-        
-        return domain, owner, repo_name
+        return _parse_url_cached(url)
     
     def _parse_github_url(self, url: str) -> tuple[str, str]:
         """Parse GitHub repository URL for MCP addon."""
@@ -4,16 +4,32 @@ Author: Huleinpylo
 License: MIT
 """
 
+import functools
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, is_dataclass
+
+try:
+    import orjson as _json_fast
+except ImportError:
+    # orjson is optional; fall back to the stdlib json module
+    _json_fast = None
+
+# Git hosting platforms GitOSINT-MCP supports; the repository analyzer shares this list
+SUPPORTED_PLATFORMS = frozenset({"github.com", "gitlab.com", "bitbucket.org"})
 
 
 @dataclass
 class MCPConfig:
     """MCP server configuration"""
+    __slots__ = (
+        'server_name', 'server_version', 'log_level', 'rate_limit_delay',
+        'max_repositories_per_user', 'max_contributors_per_repo', 'max_network_depth',
+        'max_social_connections', 'timeout_seconds', 'user_agent', 'platform'
+    )
+    
     def __init__(self):
         self.server_name: str = "gitosint-mcp"
         self.server_version: str = "1.0.0"
@@ -36,11 +52,16 @@ class MCPConfig:
 
     def is_domain_allowed(self, domain: str) -> bool:
         # N’autorise que GitHub, GitLab, Bitbucket
-        return domain in {"github.com", "gitlab.com", "bitbucket.org"}
+        return domain in SUPPORTED_PLATFORMS
 
 @dataclass
 class PlatformConfig:
     """Platform-specific configuration"""
+    __slots__ = (
+        'github_api_url', 'timeout_seconds', 'max_contributors_per_repo', 'bitbucket_api_url',
+        'gitlab_api_url', 'enable_github', 'enable_gitlab', 'enable_bitbucket'
+    )
+    
     def __init__(self, github_api_url: str, timeout_seconds: int, max_contributors_per_repo: int = 100):
         self.github_api_url = github_api_url
         self.timeout_seconds = timeout_seconds
@@ -64,6 +85,45 @@ class SecurityConfig:
     scan_timeout: int = 60
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value"""
+    return value.strip().lower() in ('true', '1', 'yes')
+
+
+def _apply_settings(target: Any, section: str, values: Any) -> None:
+    """Overlay a dict of settings onto a config section, recursing into nested sections"""
+    if not isinstance(values, dict):
+        raise TypeError(f"{section} settings must be an object, not {type(values).__name__}")
+    # Slotted sections list their settings in __slots__, the rest in the instance dict
+    settings = getattr(type(target), '__slots__', None) or vars(target)
+    for key, value in values.items():
+        if key not in settings:
+            raise TypeError(f"Unknown {section} setting: {key}")
+        current = getattr(target, key)
+        if is_dataclass(current):
+            _apply_settings(current, f"{section}.{key}", value)
+        else:
+            setattr(target, key, value)
+
+
+# Environment variable -> (config section, field, caster)
+_ENV_BINDINGS: Tuple[Tuple[str, str, str, Callable[[str], Any]], ...] = (
+    # MCP settings
+    ('GITOSINT_LOG_LEVEL', 'mcp', 'log_level', str),
+    ('GITOSINT_RATE_LIMIT_DELAY', 'mcp', 'rate_limit_delay', float),
+    ('GITOSINT_TIMEOUT', 'mcp', 'timeout_seconds', int),
+    # Platform settings
+    ('GITOSINT_GITHUB_API_URL', 'platforms', 'github_api_url', str),
+    ('GITOSINT_GITLAB_API_URL', 'platforms', 'gitlab_api_url', str),
+    ('GITOSINT_ENABLE_GITHUB', 'platforms', 'enable_github', _parse_bool),
+    ('GITOSINT_ENABLE_GITLAB', 'platforms', 'enable_gitlab', _parse_bool),
+    # Security settings
+    ('GITOSINT_RESPECT_RATE_LIMITS', 'security', 'respect_rate_limits', _parse_bool),
+    ('GITOSINT_LOG_REQUESTS', 'security', 'log_requests', _parse_bool),
+    ('GITOSINT_ANONYMIZE_RESULTS', 'security', 'anonymize_results', _parse_bool),
+)
+
+
 @dataclass
 class GitOSINTConfig:
     """Main configuration class"""
@@ -73,12 +133,13 @@ class GitOSINTConfig:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GitOSINTConfig':
-        """Create config from dictionary"""
-        return cls(
-            mcp=MCPConfig(**data.get('mcp', {})),
-            platforms=PlatformConfig(**data.get('platforms', {})),
-            security=SecurityConfig(**data.get('security', {}))
-        )
+        """Create config from dictionary, applying each section over the defaults"""
+        config = cls.default()
+        for section in ('mcp', 'platforms', 'security'):
+            values = data.get(section)
+            if values is not None:
+                _apply_settings(getattr(config, section), section, values)
+        return config
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary"""
@@ -107,8 +168,9 @@ class GitOSINTConfig:
         
         if config_path and config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    data = json.load(f)
+                # Read once as bytes; both decoders parse bytes directly
+                raw = config_path.read_bytes()
+                data = _json_fast.loads(raw) if _json_fast is not None else json.loads(raw)
                 return cls.from_dict(data)
             except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
                 print(f"Warning: Could not load config from {config_path}: {e}")
@@ -132,70 +194,48 @@ class GitOSINTConfig:
         """Save configuration to file"""
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
+        if _json_fast is not None:
+            config_path.write_bytes(_json_fast.dumps(self.to_dict(), option=_json_fast.OPT_INDENT_2))
+            return
+        
         with open(config_path, 'w') as f:
             json.dump(self.to_dict(), f, indent=2)
     
     def update_from_env(self):
         """Update configuration from environment variables"""
-        # MCP settings
-        if env_val := os.getenv('GITOSINT_LOG_LEVEL'):
-            self.mcp.log_level = env_val
-        
-        if env_val := os.getenv('GITOSINT_RATE_LIMIT_DELAY'):
-            try:
-                self.mcp.rate_limit_delay = float(env_val)
-            except ValueError:
-                pass
-        
-        if env_val := os.getenv('GITOSINT_TIMEOUT'):
+        for name, section, field, cast in _ENV_BINDINGS:
+            env_val = os.environ.get(name)
+            if not env_val:
+                continue
             try:
-                self.mcp.timeout_seconds = int(env_val)
-            except ValueError:
+                setattr(getattr(self, section), field, cast(env_val))
+            except (ValueError, TypeError):
                 pass
-        
-        # Platform settings
-        if env_val := os.getenv('GITOSINT_GITHUB_API_URL'):
-            self.platforms.github_api_url = env_val
-        
-        if env_val := os.getenv('GITOSINT_GITLAB_API_URL'):
-            self.platforms.gitlab_api_url = env_val
-        
-        if env_val := os.getenv('GITOSINT_ENABLE_GITHUB'):
-            self.platforms.enable_github = env_val.lower() in ('true', '1', 'yes')
-        
-        if env_val := os.getenv('GITOSINT_ENABLE_GITLAB'):
-            self.platforms.enable_gitlab = env_val.lower() in ('true', '1', 'yes')
-        
-        # Security settings
-        if env_val := os.getenv('GITOSINT_RESPECT_RATE_LIMITS'):
-            self.security.respect_rate_limits = env_val.lower() in ('true', '1', 'yes')
-        
-        if env_val := os.getenv('GITOSINT_LOG_REQUESTS'):
-            self.security.log_requests = env_val.lower() in ('true', '1', 'yes')
-        
-        if env_val := os.getenv('GITOSINT_ANONYMIZE_RESULTS'):
-            self.security.anonymize_results = env_val.lower() in ('true', '1', 'yes')
 
 
-# Global configuration instance
-_config: Optional[GitOSINTConfig] = None
+# Config file the global configuration is loaded from (None: default locations)
+_config_path: Optional[Path] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config() -> GitOSINTConfig:
+    """Load the global configuration once, until reload_config clears it"""
+    config = GitOSINTConfig.load_from_file(_config_path)
+    config.update_from_env()
+    return config
 
 
 def get_config() -> GitOSINTConfig:
     """Get the global configuration instance"""
-    global _config
-    if _config is None:
-        _config = GitOSINTConfig.load_from_file()
-        _config.update_from_env()
-    return _config
+    return _load_config()
 
 
 def reload_config(config_path: Optional[Path] = None) -> GitOSINTConfig:
     """Reload configuration from file"""
-    global _config
-    _config = GitOSINTConfig.load_from_file(config_path)
-    _config.update_from_env()
-    return _config
+    global _config_path
+    _config_path = config_path
+    _load_config.cache_clear()
+    return _load_config()
 
 
 def create_default_config_file(config_path: Path) -> None:
@@ -205,39 +245,30 @@ def create_default_config_file(config_path: Path) -> None:
     print(f"Created default configuration file: {config_path}")
 
 
-# Configuration validation
-def validate_config(config: GitOSINTConfig) -> bool:
-    """Validate configuration settings"""
-    issues = []
-    
-    # Validate MCP settings
-    if config.mcp.rate_limit_delay < 0:
-        issues.append("Rate limit delay cannot be negative")
-    
-    if config.mcp.timeout_seconds <= 0:
-        issues.append("Timeout must be positive")
-    
-    if config.mcp.max_repositories_per_user <= 0:
-        issues.append("Max repositories per user must be positive")
-    
-    # Validate platform URLs
-    if not config.platforms.github_api_url.startswith('https://'):
-        issues.append("GitHub API URL must use HTTPS")
-    
-    if not config.platforms.gitlab_api_url.startswith('https://'):
-        issues.append("GitLab API URL must use HTTPS")
-    
-    # Validate security settings
-    if config.security.max_email_extraction <= 0:
-        issues.append("Max email extraction must be positive")
+# Configuration validation checks, evaluated in order
+_VALIDATION_CHECKS: Tuple[Tuple[Callable[[GitOSINTConfig], bool], str], ...] = (
+    # MCP settings
+    (lambda c: c.mcp.rate_limit_delay >= 0, "Rate limit delay cannot be negative"),
+    (lambda c: c.mcp.timeout_seconds > 0, "Timeout must be positive"),
+    (lambda c: c.mcp.max_repositories_per_user > 0, "Max repositories per user must be positive"),
+    # Platform URLs
+    (lambda c: c.platforms.github_api_url.startswith('https://'), "GitHub API URL must use HTTPS"),
+    (lambda c: c.platforms.gitlab_api_url.startswith('https://'), "GitLab API URL must use HTTPS"),
+    # Security settings
+    (lambda c: c.security.max_email_extraction > 0, "Max email extraction must be positive"),
+    (lambda c: c.security.scan_timeout > 0, "Scan timeout must be positive"),
+)
+
+
+def validate_config(config: GitOSINTConfig, report: Callable[[str], None] = print) -> bool:
+    """Validate configuration settings, stopping at the first issue
     
-    if config.security.scan_timeout <= 0:
-        issues.append("Scan timeout must be positive")
+    The issue found is passed to report, which prints by default.
+    """
+    issue = next((message for check, message in _VALIDATION_CHECKS if not check(config)), None)
     
-    if issues:
-        print("Configuration validation issues:")
-        for issue in issues:
-            print(f"  - {issue}")
+    if issue is not None:
+        report(f"Configuration validation issue: {issue}")
         return False
     
     return True
@@ -22,10 +22,29 @@ from mcp.types import (
 )
 import mcp.types as types
 
+try:
+    import orjson as _json_fast
+except ImportError:
+    # orjson is optional; fall back to httpx's stdlib-based decoding
+    _json_fast = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("gitosint-mcp")
 
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if _json_fast is not None:
+        return _json_fast.loads(response.content)
+    return response.json()
+
+class ToolError(ValueError):
+    """Tool call error carrying a machine-readable error code"""
+    
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.code = code
+
 @dataclass
 class UserIntelligence:
     """Structure for user intelligence data"""
@@ -94,19 +113,19 @@ class GitOSINTAnalyzer:
         # Get repository information
         repo_response = await self.client.get(f"{base_url}/repos/{owner}/{repo}")
         repo_response.raise_for_status()
-        repo_data = repo_response.json()
+        repo_data = _decode_json(repo_response)
         
         # Get contributors
         contributors_response = await self.client.get(f"{base_url}/repos/{owner}/{repo}/contributors")
-        contributors_data = contributors_response.json() if contributors_response.status_code == 200 else []
+        contributors_data = _decode_json(contributors_response) if contributors_response.status_code == 200 else []
         
         # Get languages
         languages_response = await self.client.get(f"{base_url}/repos/{owner}/{repo}/languages")
-        languages_data = languages_response.json() if languages_response.status_code == 200 else {}
+        languages_data = _decode_json(languages_response) if languages_response.status_code == 200 else {}
         
         # Analyze commit activity (last 52 weeks)
         activity_response = await self.client.get(f"{base_url}/repos/{owner}/{repo}/stats/commit_activity")
-        activity_data = activity_response.json() if activity_response.status_code == 200 else []
+        activity_data = _decode_json(activity_response) if activity_response.status_code == 200 else []
         
         await asyncio.sleep(self.rate_limit_delay)  # Rate limiting
         
@@ -132,11 +151,11 @@ class GitOSINTAnalyzer:
         # Get project information
         project_response = await self.client.get(f"{base_url}/projects/{encoded_path}")
         project_response.raise_for_status()
-        project_data = project_response.json()
+        project_data = _decode_json(project_response)
         
         # Get contributors
         contributors_response = await self.client.get(f"{base_url}/projects/{project_data['id']}/repository/contributors")
-        contributors_data = contributors_response.json() if contributors_response.status_code == 200 else []
+        contributors_data = _decode_json(contributors_response) if contributors_response.status_code == 200 else []
         
         await asyncio.sleep(self.rate_limit_delay)
         
@@ -169,11 +188,11 @@ class GitOSINTAnalyzer:
         # Get user profile
         user_response = await self.client.get(f"{base_url}/users/{username}")
         user_response.raise_for_status()
-        user_data = user_response.json()
+        user_data = _decode_json(user_response)
         
         # Get user repositories
         repos_response = await self.client.get(f"{base_url}/users/{username}/repos?per_page=100")
-        repos_data = repos_response.json() if repos_response.status_code == 200 else []
+        repos_data = _decode_json(repos_response) if repos_response.status_code == 200 else []
         
         # Extract email addresses from commits (public repos only)
         email_addresses = await self._extract_emails_from_repos(username, repos_data[:5])  # Limit to 5 repos
@@ -213,7 +232,7 @@ class GitOSINTAnalyzer:
         
         # Search for user
         search_response = await self.client.get(f"{base_url}/users?username={username}")
-        search_data = search_response.json()
+        search_data = _decode_json(search_response)
         
         if not search_data:
             raise ValueError(f"User {username} not found on GitLab")
@@ -223,7 +242,7 @@ class GitOSINTAnalyzer:
         
         # Get user projects
         projects_response = await self.client.get(f"{base_url}/users/{user_id}/projects?per_page=100")
-        projects_data = projects_response.json() if projects_response.status_code == 200 else []
+        projects_data = _decode_json(projects_response) if projects_response.status_code == 200 else []
         
         await asyncio.sleep(self.rate_limit_delay)
         
@@ -364,9 +383,10 @@ class GitOSINTAnalyzer:
         if not activity_data:
             return {'recent_activity': 0, 'peak_week': 0, 'total_commits': 0}
         
-        total_commits = sum(week.get('total', 0) for week in activity_data)
-        recent_activity = sum(week.get('total', 0) for week in activity_data[-4:])  # Last 4 weeks
-        peak_week = max(week.get('total', 0) for week in activity_data)
+        totals = [week.get('total', 0) for week in activity_data]
+        total_commits = sum(totals)
+        recent_activity = sum(totals[-4:])  # Last 4 weeks
+        peak_week = max(totals)
         
         return {
             'recent_activity': recent_activity,
@@ -403,7 +423,7 @@ class GitOSINTAnalyzer:
                 
                 commits_response = await self.client.get(f"{commits_url}?per_page=10")
                 if commits_response.status_code == 200:
-                    commits_data = commits_response.json()
+                    commits_data = _decode_json(commits_response)
                     
                     for commit in commits_data:
                         author_email = commit.get('commit', {}).get('author', {}).get('email')
@@ -420,37 +440,23 @@ class GitOSINTAnalyzer:
     
     def _extract_languages(self, repos_data: List[Dict]) -> List[str]:
         """Extract programming languages from repositories"""
-        languages = set()
-        for repo in repos_data:
-            lang = repo.get('language')
-            if lang:
-                languages.add(lang)
-        return list(languages)
+        # dict.fromkeys dedupes in C and keeps first-seen order
+        return list(dict.fromkeys(repo['language'] for repo in repos_data if repo.get('language')))
     
     def _analyze_activity_pattern(self, repos_data: List[Dict]) -> Dict[str, Any]:
         """Analyze user activity patterns"""
         if not repos_data:
             return {}
         
-        # Analyze repository creation dates
-        creation_dates = []
-        for repo in repos_data:
-            created_at = repo.get('created_at')
-            if created_at:
-                creation_dates.append(created_at)
-        
-        # Analyze update patterns
-        update_dates = []
-        for repo in repos_data:
-            updated_at = repo.get('updated_at')
-            if updated_at:
-                update_dates.append(updated_at)
+        # ISO-8601 UTC timestamps order lexically, so compare them as strings
+        creation_dates = [repo['created_at'] for repo in repos_data if repo.get('created_at')]
+        update_dates = [repo['updated_at'] for repo in repos_data if repo.get('updated_at')]
         
         return {
             'total_repositories': len(repos_data),
             'creation_span': f"{min(creation_dates)} to {max(creation_dates)}" if creation_dates else "Unknown",
             'last_activity': max(update_dates) if update_dates else "Unknown",
-            'active_repositories': len([r for r in repos_data if r.get('updated_at')])
+            'active_repositories': len(update_dates)
         }
     
     async def _find_social_connections(self, username: str) -> List[str]:
@@ -461,7 +467,7 @@ class GitOSINTAnalyzer:
             # Get user's following list (limited)
             following_response = await self.client.get(f"https://api.github.com/users/{username}/following?per_page=50")
             if following_response.status_code == 200:
-                following_data = following_response.json()
+                following_data = _decode_json(following_response)
                 connections.extend([user['login'] for user in following_data])
             
             await asyncio.sleep(self.rate_limit_delay)
@@ -581,7 +587,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
         if name == "analyze_repository":
             repo_url = arguments.get("repo_url")
             if not repo_url:
-                raise ValueError("Repository URL is required")
+                raise ToolError("Repository URL is required", "MISSING_ARGUMENT")
             
             result = await analyzer.analyze_repository(repo_url)
             return [types.TextContent(
@@ -594,7 +600,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             platform = arguments.get("platform", "github")
             
             if not username:
-                raise ValueError("Username is required")
+                raise ToolError("Username is required", "MISSING_ARGUMENT")
             
             result = await analyzer.discover_user_info(username, platform)
             return [types.TextContent(
@@ -607,7 +613,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             search_type = arguments.get("search_type", "user")
             
             if not target:
-                raise ValueError("Target is required")
+                raise ToolError("Target is required", "MISSING_ARGUMENT")
             
             result = await analyzer.find_emails(target, search_type)
             return [types.TextContent(
@@ -620,7 +626,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             depth = arguments.get("depth", 2)
             
             if not username:
-                raise ValueError("Username is required")
+                raise ToolError("Username is required", "MISSING_ARGUMENT")
             
             result = await analyzer.map_social_network(username, depth)
             return [types.TextContent(
@@ -632,7 +638,7 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             repo_url = arguments.get("repo_url")
             
             if not repo_url:
-                raise ValueError("Repository URL is required")
+                raise ToolError("Repository URL is required", "MISSING_ARGUMENT")
             
             result = await analyzer.scan_security_issues(repo_url)
             return [types.TextContent(
@@ -641,13 +647,14 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.T
             )]
         
         else:
-            raise ValueError(f"Unknown tool: {name}")
+            raise ToolError(f"Unknown tool: {name}", "UNKNOWN_TOOL")
     
     except Exception as e:
         logger.error(f"Tool execution failed: {str(e)}")
+        code = e.code if isinstance(e, ToolError) else "TOOL_EXECUTION_FAILED"
         return [types.TextContent(
             type="text",
-            text=json.dumps({"error": str(e)}, indent=2)
+            text=json.dumps({"error": str(e), "code": code}, indent=2)
         )]
 
 async def main():
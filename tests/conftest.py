@@ -340,6 +340,14 @@ def mock_config():
     )
 
 
+@pytest.fixture(scope="session")
+def default_config():
+    """Default configuration shared by read-only tests"""
+    from src.gitosint_mcp.config import GitOSINTConfig
+    
+    return GitOSINTConfig.default()
+
+
 @pytest.fixture
 def temp_config_file(tmp_path, mock_config):
     """Create a temporary configuration file for testing"""
@@ -352,6 +360,25 @@ def temp_config_file(tmp_path, mock_config):
     return config_file
 
 
+@pytest.fixture(scope="session")
+def cached_config_file(tmp_path_factory):
+    """Write each distinct config dict to disk once per session"""
+    import json
+
+    config_dir = tmp_path_factory.mktemp("cfg")
+    cache = {}
+
+    def make(config_data):
+        key = json.dumps(config_data, sort_keys=True)
+        if key not in cache:
+            config_path = config_dir / f"config_{len(cache)}.json"
+            config_path.write_text(key)
+            cache[key] = config_path
+        return cache[key]
+
+    return make
+
+
 @pytest.fixture
 def mock_analyzer():
     """Mock GitOSINT analyzer for testing"""
@@ -6,11 +6,70 @@ import pytest
 import asyncio
 import json
 import sys
-from unittest.mock import AsyncMock, Mock, patch, MagicMock
+from typing import Final
+from unittest.mock import AsyncMock, Mock, patch
 from io import StringIO
 
 from src.gitosint_mcp.cli import GitOSINTCLI, main, print_json_result, print_formatted_result
-from src.gitosint_mcp.server import UserIntelligence, RepositoryIntel
+from src.gitosint_mcp.server import GitOSINTAnalyzer, UserIntelligence, RepositoryIntel
+
+
+# Immutable analyzer payloads shared across tests
+REPO_INTEL_FIXTURE: Final = RepositoryIntel(
+    name="test/repo",
+    description="Test repository",
+    stars=100,
+    forks=25,
+    language="Python",
+    topics=["test", "automation"],
+    contributors=[
+        {"login": "user1", "contributions": 50},
+        {"login": "user2", "contributions": 30}
+    ],
+    commit_activity={"recent_activity": 10, "peak_week": 15},
+    security_issues=["issue1", "issue2"],
+    dependencies={"Python": 1000}
+)
+
+USER_INTEL_FIXTURE: Final = UserIntelligence(
+    username="testuser",
+    email_addresses=["test@example.com", "work@company.com"],
+    repositories=[
+        {"name": "repo1", "stars": 10},
+        {"name": "repo2", "stars": 5}
+    ],
+    commit_count=25,
+    languages=["Python", "JavaScript"],
+    activity_pattern={"total_repos": 2},
+    social_connections=["friend1", "friend2"],
+    profile_data={
+        "name": "Test User",
+        "company": "Test Corp",
+        "location": "San Francisco"
+    }
+)
+
+NETWORK_FIXTURE: Final = {
+    "center": "testuser",
+    "depth": 2,
+    "total_connections": 8,
+    "connections": {
+        "repo1": [
+            {"username": "collaborator1", "contributions": 15},
+            {"username": "collaborator2", "contributions": 8}
+        ],
+        "repo2": [
+            {"username": "collaborator3", "contributions": 12}
+        ]
+    }
+}
+
+SECURITY_ISSUES_FIXTURE: Final = [
+    {"type": "potential_secret_exposure", "severity": "high", "description": "API key found"},
+    {"type": "suspicious_dependency", "severity": "medium", "description": "Crypto miner"},
+    {"type": "inactive_repository", "severity": "low", "description": "No recent commits"},
+    {"type": "weak_authentication", "severity": "high", "description": "No 2FA"}
+]
 
 
 class TestGitOSINTCLI:
@@ -21,37 +80,21 @@ class TestGitOSINTCLI:
         """Create CLI instance for testing"""
         cli = GitOSINTCLI()
         # Mock the analyzer to avoid actual HTTP calls
-        cli.analyzer = AsyncMock()
+        cli.analyzer = AsyncMock(spec=GitOSINTAnalyzer)
         yield cli
         await cli.close()
     
     @pytest.mark.asyncio
     async def test_cli_initialization(self):
         """Test CLI initialization"""
-        cli = GitOSINTCLI()
+        with patch('src.gitosint_mcp.cli.GitOSINTAnalyzer', Mock):
+            cli = GitOSINTCLI()
         assert cli.analyzer is not None
-        await cli.close()
     
     @pytest.mark.asyncio
     async def test_analyze_repository_success(self, cli):
         """Test successful repository analysis via CLI"""
-        mock_result = RepositoryIntel(
-            name="test/repo",
-            description="Test repository",
-            stars=100,
-            forks=25,
-            language="Python",
-            topics=["test", "automation"],
-            contributors=[
-                {"login": "user1", "contributions": 50},
-                {"login": "user2", "contributions": 30}
-            ],
-            commit_activity={"recent_activity": 10, "peak_week": 15},
-            security_issues=["issue1", "issue2"],
-            dependencies={"Python": 1000}
-        )
-        
-        cli.analyzer.analyze_repository.return_value = mock_result
+        cli.analyzer.analyze_repository.return_value = REPO_INTEL_FIXTURE
         
         result = await cli.analyze_repository("https://github.com/test/repo")
         
@@ -82,25 +125,7 @@ class TestGitOSINTCLI:
     @pytest.mark.asyncio
     async def test_discover_user_success(self, cli):
         """Test successful user discovery via CLI"""
-        mock_result = UserIntelligence(
-            username="testuser",
-            email_addresses=["test@example.com", "work@company.com"],
-            repositories=[
-                {"name": "repo1", "stars": 10},
-                {"name": "repo2", "stars": 5}
-            ],
-            commit_count=25,
-            languages=["Python", "JavaScript"],
-            activity_pattern={"total_repos": 2},
-            social_connections=["friend1", "friend2"],
-            profile_data={
-                "name": "Test User",
-                "company": "Test Corp",
-                "location": "San Francisco"
-            }
-        )
-        
-        cli.analyzer.discover_user_info.return_value = mock_result
+        cli.analyzer.discover_user_info.return_value = USER_INTEL_FIXTURE
         
         result = await cli.discover_user("testuser", "github")
         
@@ -172,22 +197,7 @@ class TestGitOSINTCLI:
     @pytest.mark.asyncio
     async def test_map_network_success(self, cli):
         """Test successful network mapping via CLI"""
-        mock_network = {
-            "center": "testuser",
-            "depth": 2,
-            "total_connections": 8,
-            "connections": {
-                "repo1": [
-                    {"username": "collaborator1", "contributions": 15},
-                    {"username": "collaborator2", "contributions": 8}
-                ],
-                "repo2": [
-                    {"username": "collaborator3", "contributions": 12}
-                ]
-            }
-        }
-        
-        cli.analyzer.map_social_network.return_value = mock_network
+        cli.analyzer.map_social_network.return_value = NETWORK_FIXTURE
         
         result = await cli.map_network("testuser", 2)
         
@@ -210,14 +220,7 @@ class TestGitOSINTCLI:
     @pytest.mark.asyncio
     async def test_scan_security_success(self, cli):
         """Test successful security scanning via CLI"""
-        mock_issues = [
-            {"type": "potential_secret_exposure", "severity": "high", "description": "API key found"},
-            {"type": "suspicious_dependency", "severity": "medium", "description": "Crypto miner"},
-            {"type": "inactive_repository", "severity": "low", "description": "No recent commits"},
-            {"type": "weak_authentication", "severity": "high", "description": "No 2FA"}
-        ]
-        
-        cli.analyzer.scan_security_issues.return_value = mock_issues
+        cli.analyzer.scan_security_issues.return_value = SECURITY_ISSUES_FIXTURE
         
         result = await cli.scan_security("https://github.com/test/repo")
         
@@ -274,12 +277,25 @@ class TestCLIOutputFormatting:
             }
         }
         
+        with patch('builtins.print') as mock_print:
+            print_json_result(result, pretty=True)
+            
+            mock_print.assert_called_once()
+            printed_text = mock_print.call_args[0][0]
+            assert json.loads(printed_text) == result
+            assert "\n" in printed_text
+    
+    def test_print_json_result_compact(self):
+        """Test compact JSON output formatting"""
+        result = {"success": True, "data": {"name": "test/repo"}}
+        
         with patch('builtins.print') as mock_print:
             print_json_result(result, pretty=False)
             
             mock_print.assert_called_once()
             printed_text = mock_print.call_args[0][0]
-            assert '{"success":true,"data":{"name":"test/repo"}}' in printed_text.replace(' ', '')
+            assert json.loads(printed_text) == result
+            assert "\n" not in printed_text
     
     def test_print_formatted_result_analyze_repo(self):
         """Test formatted output for repository analysis"""
@@ -450,196 +466,165 @@ class TestCLIMainFunction:
     """Test CLI main function and argument parsing"""
     
     @pytest.mark.asyncio
-    async def test_main_analyze_repo_command(self):
+    async def test_main_analyze_repo_command(self, monkeypatch):
         """Test main function with analyze-repo command"""
         test_args = ["gitosint-mcp", "analyze-repo", "https://github.com/test/repo"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                mock_cli = AsyncMock()
-                mock_cli.analyze_repository.return_value = {"success": True, "data": {"name": "test/repo"}}
-                mock_cli_class.return_value = mock_cli
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            mock_cli.analyze_repository.return_value = {"success": True, "data": {"name": "test/repo"}}
+            mock_cli_class.return_value = mock_cli
+            
+            with patch('src.gitosint_mcp.cli.print_formatted_result') as mock_print:
+                await main()
                 
-                with patch('src.gitosint_mcp.cli.print_formatted_result') as mock_print:
-                    await main()
-                    
-                    mock_cli.analyze_repository.assert_called_once_with("https://github.com/test/repo")
-                    mock_print.assert_called_once()
-                    mock_cli.close.assert_called_once()
+                mock_cli.analyze_repository.assert_called_once_with("https://github.com/test/repo")
+                mock_print.assert_called_once()
+                mock_cli.close.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_main_discover_user_command(self):
+    async def test_main_discover_user_command(self, monkeypatch):
         """Test main function with discover-user command"""
         test_args = ["gitosint-mcp", "discover-user", "testuser", "--platform", "github"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                mock_cli = AsyncMock()
-                mock_cli.discover_user.return_value = {"success": True, "data": {"username": "testuser"}}
-                mock_cli_class.return_value = mock_cli
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            mock_cli.discover_user.return_value = {"success": True, "data": {"username": "testuser"}}
+            mock_cli_class.return_value = mock_cli
+            
+            with patch('src.gitosint_mcp.cli.print_formatted_result') as mock_print:
+                await main()
                 
-                with patch('src.gitosint_mcp.cli.print_formatted_result') as mock_print:
-                    await main()
-                    
-                    mock_cli.discover_user.assert_called_once_with("testuser", "github")
-                    mock_print.assert_called_once()
+                mock_cli.discover_user.assert_called_once_with("testuser", "github")
+                mock_print.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_main_json_output(self):
+    async def test_main_json_output(self, monkeypatch):
         """Test main function with JSON output"""
         test_args = ["gitosint-mcp", "analyze-repo", "https://github.com/test/repo", "--json"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                mock_cli = AsyncMock()
-                mock_cli.analyze_repository.return_value = {"success": True, "data": {"name": "test/repo"}}
-                mock_cli_class.return_value = mock_cli
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            mock_cli.analyze_repository.return_value = {"success": True, "data": {"name": "test/repo"}}
+            mock_cli_class.return_value = mock_cli
+            
+            with patch('src.gitosint_mcp.cli.print_json_result') as mock_print:
+                await main()
                 
-                with patch('src.gitosint_mcp.cli.print_json_result') as mock_print:
-                    await main()
-                    
-                    mock_print.assert_called_once()
+                mock_print.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_main_no_command(self):
+    async def test_main_no_command(self, monkeypatch):
         """Test main function with no command"""
         test_args = ["gitosint-mcp"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('argparse.ArgumentParser.print_help') as mock_help:
-                await main()
-                mock_help.assert_called_once()
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('argparse.ArgumentParser.print_help') as mock_help:
+            await main()
+            mock_help.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_main_keyboard_interrupt(self):
+    async def test_main_keyboard_interrupt(self, monkeypatch):
         """Test main function handling keyboard interrupt"""
         test_args = ["gitosint-mcp", "analyze-repo", "https://github.com/test/repo"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                mock_cli = AsyncMock()
-                mock_cli.analyze_repository.side_effect = KeyboardInterrupt()
-                mock_cli_class.return_value = mock_cli
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            mock_cli.analyze_repository.side_effect = KeyboardInterrupt()
+            mock_cli_class.return_value = mock_cli
+            
+            with patch('builtins.print') as mock_print:
+                with pytest.raises(SystemExit) as exc_info:
+                    await main()
                 
-                with patch('builtins.print') as mock_print:
-                    with pytest.raises(SystemExit) as exc_info:
-                        await main()
-                    
-                    assert exc_info.value.code == 1
-                    mock_print.assert_called_with("\n❌ Operation cancelled by user")
+                assert exc_info.value.code == 1
+                mock_print.assert_called_with("\n❌ Operation cancelled by user")
     
     @pytest.mark.asyncio
-    async def test_main_unexpected_error(self):
+    async def test_main_unexpected_error(self, monkeypatch):
         """Test main function handling unexpected errors"""
         test_args = ["gitosint-mcp", "analyze-repo", "https://github.com/test/repo"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                mock_cli = AsyncMock()
-                mock_cli.analyze_repository.side_effect = Exception("Unexpected error")
-                mock_cli_class.return_value = mock_cli
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            mock_cli.analyze_repository.side_effect = Exception("Unexpected error")
+            mock_cli_class.return_value = mock_cli
+            
+            with patch('builtins.print') as mock_print:
+                with pytest.raises(SystemExit) as exc_info:
+                    await main()
                 
-                with patch('builtins.print') as mock_print:
-                    with pytest.raises(SystemExit) as exc_info:
-                        await main()
-                    
-                    assert exc_info.value.code == 1
-                    mock_print.assert_called_with("❌ Unexpected error: Unexpected error")
+                assert exc_info.value.code == 1
+                mock_print.assert_called_with("❌ Unexpected error: Unexpected error")
     
     @pytest.mark.asyncio
-    async def test_main_failed_operation_exit_code(self):
+    async def test_main_failed_operation_exit_code(self, monkeypatch):
         """Test main function exit code for failed operations"""
         test_args = ["gitosint-mcp", "analyze-repo", "https://github.com/test/repo"]
         
-        with patch.object(sys, 'argv', test_args):
-            with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                mock_cli = AsyncMock()
-                mock_cli.analyze_repository.return_value = {"success": False, "error": "Failed"}
-                mock_cli_class.return_value = mock_cli
+        monkeypatch.setattr(sys, "argv", test_args)
+        
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            mock_cli.analyze_repository.return_value = {"success": False, "error": "Failed"}
+            mock_cli_class.return_value = mock_cli
+            
+            with patch('src.gitosint_mcp.cli.print_formatted_result'):
+                with pytest.raises(SystemExit) as exc_info:
+                    await main()
                 
-                with patch('src.gitosint_mcp.cli.print_formatted_result'):
-                    with pytest.raises(SystemExit) as exc_info:
-                        await main()
-                    
-                    assert exc_info.value.code == 1
+                assert exc_info.value.code == 1
 
 
 class TestCLIEdgeCases:
     """Test CLI edge cases and error conditions"""
     
     @pytest.mark.asyncio
-    async def test_all_commands_with_defaults(self):
+    @pytest.mark.parametrize("argv_tail,method_name", [
+        (["discover-user", "testuser"], "discover_user"),
+        (["find-emails", "testuser"], "find_emails"),
+        (["map-network", "testuser"], "map_network"),
+    ])
+    async def test_all_commands_with_defaults(self, monkeypatch, argv_tail, method_name):
         """Test that all commands work with default parameters"""
-        commands = [
-            (["discover-user", "testuser"], "discover_user"),
-            (["find-emails", "testuser"], "find_emails"),
-            (["map-network", "testuser"], "map_network"),
-        ]
+        monkeypatch.setattr(sys, "argv", ["gitosint-mcp"] + argv_tail)
         
-        for args, method_name in commands:
-            test_args = ["gitosint-mcp"] + args
-            
-            with patch.object(sys, 'argv', test_args):
-                with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
-                    mock_cli = AsyncMock()
-                    getattr(mock_cli, method_name).return_value = {"success": True, "data": {}}
-                    mock_cli_class.return_value = mock_cli
-                    
-                    with patch('src.gitosint_mcp.cli.print_formatted_result'):
-                        await main()
-                        
-                        # Verify the method was called
-                        assert getattr(mock_cli, method_name).called
-    
-    @pytest.mark.asyncio
-    async def test_version_argument(self):
-        """Test --version argument"""
-        test_args = ["gitosint-mcp", "--version"]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                await main()
+        with patch('src.gitosint_mcp.cli.GitOSINTCLI') as mock_cli_class:
+            mock_cli = AsyncMock(spec=GitOSINTCLI)
+            getattr(mock_cli, method_name).return_value = {"success": True, "data": {}}
+            mock_cli_class.return_value = mock_cli
             
-            # argparse exits with code 0 for --version
-            assert exc_info.value.code == 0
-    
-    @pytest.mark.asyncio
-    async def test_help_argument(self):
-        """Test --help argument"""
-        test_args = ["gitosint-mcp", "--help"]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
+            with patch('src.gitosint_mcp.cli.print_formatted_result'):
                 await main()
-            
-            # argparse exits with code 0 for --help
-            assert exc_info.value.code == 0
+                
+                # Verify the method was called
+                assert getattr(mock_cli, method_name).called
     
     @pytest.mark.asyncio
-    async def test_invalid_command(self):
-        """Test invalid command handling"""
-        test_args = ["gitosint-mcp", "invalid-command"]
-        
-        with patch.object(sys, 'argv', test_args):
-            with pytest.raises(SystemExit) as exc_info:
-                await main()
-            
-            # argparse exits with code 2 for invalid arguments
-            assert exc_info.value.code == 2
-
+    @pytest.mark.parametrize("argv_tail,code", [
+        (["--version"], 0),  # argparse exits with code 0 for --version
+        (["--help"], 0),  # argparse exits with code 0 for --help
+        (["invalid-command"], 2),  # argparse exits with code 2 for invalid arguments
+    ])
+    async def test_argparse_exit(self, monkeypatch, argv_tail, code):
+        """Test --version, --help and invalid command exit codes"""
+        monkeypatch.setattr(sys, "argv", ["gitosint-mcp"] + argv_tail)
+        
+        with pytest.raises(SystemExit) as exc_info:
+            await main()
+        
+        assert exc_info.value.code == code
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])result(result, pretty=True)
-            
-            mock_print.assert_called_once()
-            printed_text = mock_print.call_args[0][0]
-            assert '"success": true' in printed_text
-            assert '"name": "test/repo"' in printed_text
-            assert '"stars": 100' in printed_text
-    
-    def test_print_json_result_compact(self):
-        """Test compact JSON output formatting"""
-        result = {"success": True, "data": {"name": "test/repo"}}
-        
-        with patch('builtins.print') as mock_print:
-            print_json_
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,8 @@
+"""
+Pytest configuration for GitOSINT-MCP unit tests
+"""
+
+
+def pytest_configure(config):
+    """Import the server module (httpx, MCP SDK) once per process, up front"""
+    import src.gitosint_mcp.server  # noqa: F401
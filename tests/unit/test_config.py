@@ -3,10 +3,10 @@ Test suite for GitOSINT-MCP configuration module
 """
 
 import pytest
+import copy
 import json
+import operator
 import os
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 from dataclasses import dataclass
 
@@ -23,13 +23,30 @@ from src.gitosint_mcp.config import (
 )
 
 
+@pytest.fixture
+def fresh_cfg(default_config):
+    """Private copy of the default configuration for mutating tests"""
+    return copy.deepcopy(default_config)
+
+
+@pytest.fixture(scope="module")
+def default_mcp_cfg():
+    """Default MCP section shared by read-only tests"""
+    return MCPConfig()
+
+
+@pytest.fixture(scope="module")
+def env_config():
+    """Default configuration shared by tests that re-apply env overrides"""
+    return GitOSINTConfig.default()
+
 
 class TestMCPConfig:
     """Test MCP configuration dataclass"""
     
-    def test_default_mcp_config(self):
+    def test_default_mcp_config(self, default_mcp_cfg):
         """Test default MCP configuration values"""
-        config = MCPConfig()
+        config = default_mcp_cfg
         
         assert config.server_name == "gitosint-mcp"
         assert config.server_version == "1.0.0"
@@ -60,6 +77,16 @@ class TestMCPConfig:
         assert config.log_level == "DEBUG"
         assert config.rate_limit_delay == 2.5
         assert config.timeout_seconds == 60
+    
+    @pytest.mark.parametrize("domain,allowed", [
+        ("github.com", True),
+        ("gitlab.com", True),
+        ("bitbucket.org", True),
+        ("malicious.com", False),
+    ])
+    def test_domain_allowed_check(self, default_mcp_cfg, domain, allowed):
+        """Test only supported platforms are allowed"""
+        assert default_mcp_cfg.is_domain_allowed(domain) is allowed
 
 
 class TestPlatformConfig:
@@ -126,9 +153,9 @@ class TestSecurityConfig:
 class TestGitOSINTConfig:
     """Test main GitOSINT configuration class"""
     
-    def test_default_config_creation(self):
+    def test_default_config_creation(self, default_config):
         """Test creating default configuration"""
-        config = GitOSINTConfig.default()
+        config = default_config
         
         assert isinstance(config.mcp, MCPConfig)
         assert isinstance(config.platforms, PlatformConfig)
@@ -166,9 +193,9 @@ class TestGitOSINTConfig:
         assert config.security.anonymize_results is True
         assert config.security.max_email_extraction == 5
     
-    def test_config_to_dict(self):
+    def test_config_to_dict(self, default_config):
         """Test converting configuration to dictionary"""
-        config = GitOSINTConfig.default()
+        config = default_config
         data = config.to_dict()
         
         assert "mcp" in data
@@ -179,17 +206,16 @@ class TestGitOSINTConfig:
         assert data["platforms"]["enable_github"] is True
         assert data["security"]["respect_rate_limits"] is True
     
-    def test_config_load_from_file_not_exists(self):
+    def test_config_load_from_file_not_exists(self, tmp_path):
         """Test loading config when file doesn't exist"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            non_existent_path = Path(tmpdir) / "non_existent.json"
-            config = GitOSINTConfig.load_from_file(non_existent_path)
-            
-            # Should return default config when file doesn't exist
-            assert isinstance(config, GitOSINTConfig)
-            assert config.mcp.server_name == "gitosint-mcp"
+        non_existent_path = tmp_path / "non_existent.json"
+        config = GitOSINTConfig.load_from_file(non_existent_path)
+        
+        # Should return default config when file doesn't exist
+        assert isinstance(config, GitOSINTConfig)
+        assert config.mcp.server_name == "gitosint-mcp"
     
-    def test_config_load_from_file_exists(self):
+    def test_config_load_from_file_exists(self, cached_config_file):
         """Test loading config from existing file"""
         config_data = {
             "mcp": {
@@ -204,40 +230,31 @@ class TestGitOSINTConfig:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_path = Path(f.name)
+        config = GitOSINTConfig.load_from_file(cached_config_file(config_data))
         
-        try:
-            config = GitOSINTConfig.load_from_file(config_path)
-            
-            assert config.mcp.server_name == "loaded-server"
-            assert config.mcp.log_level == "DEBUG"
-            assert config.platforms.enable_github is False
-            assert config.security.anonymize_results is True
-        finally:
-            config_path.unlink()
+        assert config.mcp.server_name == "loaded-server"
+        assert config.mcp.log_level == "DEBUG"
+        assert config.platforms.enable_github is False
+        assert config.security.anonymize_results is True
     
-    def test_config_save_to_file(self):
+    def test_config_save_to_file(self, fresh_cfg, tmp_path):
         """Test saving configuration to file"""
-        config = GitOSINTConfig.default()
+        config = fresh_cfg
         config.mcp.server_name = "saved-server"
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "test_config.json"
-            config.save_to_file(config_path)
-            
-            assert config_path.exists()
-            
-            # Load and verify
-            with open(config_path) as f:
-                data = json.load(f)
-            
-            assert data["mcp"]["server_name"] == "saved-server"
+        config_path = tmp_path / "test_config.json"
+        config.save_to_file(config_path)
+        
+        assert config_path.exists()
+        
+        # Load and verify
+        data = json.loads(config_path.read_text())
+        
+        assert data["mcp"]["server_name"] == "saved-server"
     
-    def test_config_update_from_env(self):
+    def test_config_update_from_env(self, fresh_cfg):
         """Test updating configuration from environment variables"""
-        config = GitOSINTConfig.default()
+        config = fresh_cfg
         
         env_vars = {
             'GITOSINT_LOG_LEVEL': 'DEBUG',
@@ -264,9 +281,9 @@ class TestGitOSINTConfig:
         assert config.security.log_requests is True
         assert config.security.anonymize_results is True
     
-    def test_config_update_from_env_invalid_values(self):
+    def test_config_update_from_env_invalid_values(self, fresh_cfg):
         """Test handling invalid environment variable values"""
-        config = GitOSINTConfig.default()
+        config = fresh_cfg
         original_delay = config.mcp.rate_limit_delay
         original_timeout = config.mcp.timeout_seconds
         
@@ -286,60 +303,37 @@ class TestGitOSINTConfig:
 class TestConfigValidation:
     """Test configuration validation"""
     
-    def test_valid_config(self):
+    def test_valid_config(self, default_config):
         """Test validation of valid configuration"""
-        config = GitOSINTConfig.default()
-        assert validate_config(config) is True
-    
-    def test_invalid_rate_limit_delay(self):
-        """Test validation with invalid rate limit delay"""
-        config = GitOSINTConfig.default()
-        config.mcp.rate_limit_delay = -1.0
-        
-        with patch('builtins.print') as mock_print:
-            result = validate_config(config)
-            assert result is False
-            mock_print.assert_called()
-    
-    def test_invalid_timeout(self):
-        """Test validation with invalid timeout"""
-        config = GitOSINTConfig.default()
-        config.mcp.timeout_seconds = 0
-        
-        with patch('builtins.print') as mock_print:
-            result = validate_config(config)
-            assert result is False
-            mock_print.assert_called()
-    
-    def test_invalid_max_repositories(self):
-        """Test validation with invalid max repositories"""
-        config = GitOSINTConfig.default()
-        config.mcp.max_repositories_per_user = 0
-        
-        with patch('builtins.print') as mock_print:
-            result = validate_config(config)
-            assert result is False
-            mock_print.assert_called()
+        config = default_config
+        errs = []
+        assert validate_config(config, errs.append) is True
+        assert errs == []
     
-    def test_invalid_api_urls(self):
-        """Test validation with invalid API URLs"""
-        config = GitOSINTConfig.default()
-        config.platforms.github_api_url = "http://insecure.com"
-        
-        with patch('builtins.print') as mock_print:
-            result = validate_config(config)
-            assert result is False
-            mock_print.assert_called()
+    @pytest.mark.parametrize("attr_path,bad_value", [
+        ("mcp.rate_limit_delay", -1.0),
+        ("mcp.timeout_seconds", 0),
+        ("mcp.max_repositories_per_user", 0),
+        ("platforms.github_api_url", "http://insecure.com"),
+        ("security.max_email_extraction", 0),
+    ])
+    def test_invalid_config_value(self, fresh_cfg, attr_path, bad_value):
+        """Test validation rejects each invalid setting"""
+        section, _, field = attr_path.rpartition(".")
+        setattr(operator.attrgetter(section)(fresh_cfg), field, bad_value)
+        
+        errs = []
+        assert validate_config(fresh_cfg, errs.append) is False
+        assert len(errs) == 1
     
-    def test_invalid_email_extraction(self):
-        """Test validation with invalid email extraction limit"""
-        config = GitOSINTConfig.default()
-        config.security.max_email_extraction = 0
-        
-        with patch('builtins.print') as mock_print:
-            result = validate_config(config)
-            assert result is False
-            mock_print.assert_called()
+    def test_validation_stops_at_first_issue(self, fresh_cfg):
+        """Test only the first failing check is reported when several fail"""
+        fresh_cfg.mcp.rate_limit_delay = -1.0
+        fresh_cfg.platforms.github_api_url = "http://insecure.com"
+        
+        errs = []
+        assert validate_config(fresh_cfg, errs.append) is False
+        assert errs == ["Configuration validation issue: Rate limit delay cannot be negative"]
 
 
 class TestGlobalConfigFunctions:
@@ -349,7 +343,7 @@ class TestGlobalConfigFunctions:
         """Test that get_config returns singleton instance"""
         # Reset global config
         import src.gitosint_mcp.config
-        src.gitosint_mcp.config._config = None
+        src.gitosint_mcp.config._load_config.cache_clear()
         
         config1 = get_config()
         config2 = get_config()
@@ -357,41 +351,32 @@ class TestGlobalConfigFunctions:
         assert config1 is config2
         assert isinstance(config1, GitOSINTConfig)
     
-    def test_reload_config(self):
+    def test_reload_config(self, cached_config_file):
         """Test reloading configuration"""
-        # Create a test config file
         config_data = {
             "mcp": {"server_name": "reloaded-server"}
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_path = Path(f.name)
-        
-        try:
-            config = reload_config(config_path)
-            assert config.mcp.server_name == "reloaded-server"
-        finally:
-            config_path.unlink()
+        config = reload_config(cached_config_file(config_data))
+        assert config.mcp.server_name == "reloaded-server"
     
-    def test_create_default_config_file(self):
+    def test_create_default_config_file(self, tmp_path):
         """Test creating default configuration file"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "default_config.json"
-            
-            with patch('builtins.print') as mock_print:
-                create_default_config_file(config_path)
-            
-            assert config_path.exists()
-            mock_print.assert_called_with(f"Created default configuration file: {config_path}")
-            
-            # Verify the file contains valid config
-            with open(config_path) as f:
-                data = json.load(f)
-            
-            assert "mcp" in data
-            assert "platforms" in data
-            assert "security" in data
+        config_path = tmp_path / "default_config.json"
+        
+        with patch('builtins.print') as mock_print:
+            create_default_config_file(config_path)
+        
+        assert config_path.exists()
+        mock_print.assert_called_with(f"Created default configuration file: {config_path}")
+        
+        # Verify the file contains valid config
+        with open(config_path) as f:
+            data = json.load(f)
+        
+        assert "mcp" in data
+        assert "platforms" in data
+        assert "security" in data
 
 
 class TestConfigEdgeCases:
@@ -420,38 +405,50 @@ class TestConfigEdgeCases:
         assert config.platforms.enable_github is True  # Default value
         assert config.security.respect_rate_limits is True  # Default value
     
-    def test_config_load_invalid_json(self):
+    @pytest.mark.parametrize("data,message", [
+        pytest.param({"mcp": {"no_such_setting": 1}}, "Unknown mcp setting", id="unknown-key"),
+        pytest.param({"mcp": {"get_user_agent": "x"}}, "Unknown mcp setting", id="method-name"),
+        pytest.param({"security": {"no_such_setting": 1}}, "Unknown security setting", id="unknown-dataclass-key"),
+        pytest.param({"mcp": ["server_name"]}, "mcp settings must be an object", id="non-mapping"),
+        pytest.param({"mcp": {"platform": "x"}}, "mcp.platform settings must be an object", id="nested-non-mapping"),
+        pytest.param({"mcp": {"platform": {"no_such_setting": 1}}}, "Unknown mcp.platform setting", id="nested-unknown-key"),
+    ])
+    def test_config_from_dict_rejects_invalid_sections(self, data, message):
+        """Test from_dict rejects unknown settings and non-object sections"""
+        with pytest.raises(TypeError, match=message):
+            GitOSINTConfig.from_dict(data)
+    
+    def test_config_from_dict_nested_section(self):
+        """Test nested sections are updated in place rather than replaced"""
+        config = GitOSINTConfig.from_dict({"mcp": {"platform": {"timeout_seconds": 5}}})
+        
+        assert isinstance(config.mcp.platform, PlatformConfig)
+        assert config.mcp.platform.timeout_seconds == 5
+        assert config.mcp.platform.github_api_url == "https://api.github.com"
+    
+    def test_config_load_invalid_json(self, tmp_path):
         """Test loading configuration from invalid JSON file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json content {")
-            config_path = Path(f.name)
-        
-        try:
-            with patch('builtins.print') as mock_print:
-                config = GitOSINTConfig.load_from_file(config_path)
-            
-            # Should return default config and print warning
-            assert isinstance(config, GitOSINTConfig)
-            assert config.mcp.server_name == "gitosint-mcp"
-            mock_print.assert_called()
-        finally:
-            config_path.unlink()
+        config_path = tmp_path / "cfg.json"
+        config_path.write_text("invalid json content {")
+        
+        with patch('builtins.print') as mock_print:
+            config = GitOSINTConfig.load_from_file(config_path)
+        
+        # Should return default config and print warning
+        assert isinstance(config, GitOSINTConfig)
+        assert config.mcp.server_name == "gitosint-mcp"
+        mock_print.assert_called()
     
-    def test_env_var_boolean_parsing(self):
+    @pytest.mark.parametrize("val,expected", [
+        ("true", True), ("1", True), ("yes", True), ("TRUE", True), ("Yes", True),
+        ("false", False), ("0", False), ("no", False), ("FALSE", False), ("No", False),
+        ("anything_else", False),
+    ])
+    def test_env_var_boolean_parsing(self, env_config, monkeypatch, val, expected):
         """Test various boolean value parsing from environment"""
-        config = GitOSINTConfig.default()
-        
-        # Test various true values
-        for true_val in ['true', '1', 'yes', 'TRUE', 'Yes']:
-            with patch.dict(os.environ, {'GITOSINT_ENABLE_GITHUB': true_val}):
-                config.update_from_env()
-                assert config.platforms.enable_github is True
-        
-        # Test various false values
-        for false_val in ['false', '0', 'no', 'FALSE', 'No', 'anything_else']:
-            with patch.dict(os.environ, {'GITOSINT_ENABLE_GITHUB': false_val}):
-                config.update_from_env()
-                assert config.platforms.enable_github is False
+        monkeypatch.setenv("GITOSINT_ENABLE_GITHUB", val)
+        env_config.update_from_env()
+        assert env_config.platforms.enable_github is expected
 
 
 if __name__ == "__main__":
@@ -13,95 +13,87 @@ from gitosint_mcp.config import MCPConfig as Config
 
 pytestmark = pytest.mark.unit
 
+@pytest.fixture(scope="module")
+def sample_repo_info():
+    """Repository info shared by analysis tests."""
+    return RepositoryInfo(
+        name="test-repo",
+        owner="testuser",
+        full_name="testuser/test-repo",
+        description="Test repository",
+        primary_language="Python",
+        languages={},
+        stars=50,
+        forks=10,
+        watchers=45,
+        size_kb=1024,
+        created_at="2020-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+        pushed_at="2024-01-01T00:00:00Z",
+        is_fork=False,
+        is_archived=False,
+        is_private=False,
+        default_branch="main",
+        topics=["python", "testing"],
+        license_name="MIT",
+        homepage=None
+    )
+
+@pytest.fixture(scope="module")
+def sample_contributors():
+    """Contributor list shared by analysis tests."""
+    return [
+        ContributorInfo(
+            login="testuser",
+            id=12345,
+            type="User",
+            contributions=50,
+            avatar_url="https://github.com/images/testuser",
+            profile_url="https://github.com/testuser"
+        )
+    ]
+
 class TestRepositoryAnalyzer:
     """Test repository analyzer for MCP addon."""
     
-    @pytest.fixture
-    def analyzer(self, test_config):
-        """Create repository analyzer instance."""
-        return RepositoryAnalyzer(test_config)
+    @pytest.fixture(scope="module")
+    def analyzer(self):
+        """Create repository analyzer instance shared by the module."""
+        return RepositoryAnalyzer(Config())
     
-    def test_parse_repository_url_github(self, analyzer):
-        """Test GitHub repository URL parsing."""
-        url = "https://github.com/microsoft/vscode"
-        platform, owner, repo = analyzer._parse_repository_url(url)
-        
-        assert platform == "github.com"
-        assert owner == "microsoft"
-        assert repo == "vscode"
+    @pytest.mark.parametrize("url,expected", [
+        ("https://github.com/microsoft/vscode", ("github.com", "microsoft", "vscode")),
+        ("https://github.com/microsoft/vscode.git", ("github.com", "microsoft", "vscode")),
+        ("https://gitlab.com/gitlab-org/gitlab", ("gitlab.com", "gitlab-org", "gitlab")),
+        ("git://github.com/microsoft/vscode.git", ("github.com", "microsoft", "vscode")),
+        ("ssh://github.com/microsoft/vscode", ("github.com", "microsoft", "vscode")),
+        ("https://github.com//microsoft/vscode/", ("github.com", "microsoft", "vscode")),
+    ])
+    def test_parse_repository_url(self, analyzer, url, expected):
+        """Test repository URL parsing across platforms and .git suffix."""
+        assert analyzer._parse_repository_url(url) == expected
     
-    def test_parse_repository_url_with_git_suffix(self, analyzer):
-        """Test repository URL parsing with .git suffix."""
-        url = "https://github.com/microsoft/vscode.git"
-        platform, owner, repo = analyzer._parse_repository_url(url)
-        
-        assert platform == "github.com"
-        assert owner == "microsoft"
-        assert repo == "vscode"
-    
-    def test_parse_repository_url_gitlab(self, analyzer):
-        """Test GitLab repository URL parsing."""
-        url = "https://gitlab.com/gitlab-org/gitlab"
-        platform, owner, repo = analyzer._parse_repository_url(url)
-        
-        assert platform == "gitlab.com"
-        assert owner == "gitlab-org"
-        assert repo == "gitlab"
-    
-    def test_parse_invalid_repository_url(self, analyzer):
-        """Test parsing invalid repository URL."""
-        with pytest.raises(ValueError, match="Invalid repository URL format"):
-            analyzer._parse_repository_url("https://github.com/invalid")
-    
-    def test_parse_unsupported_platform(self, analyzer):
-        """Test parsing URL from unsupported platform."""
-        with pytest.raises(ValueError, match="Unsupported platform"):
-            analyzer._parse_repository_url("https://unsupported.com/user/repo")
+    @pytest.mark.parametrize("url,message", [
+        ("https://github.com/invalid", "Invalid repository URL format"),
+        ("https://unsupported.com/user/repo", "Unsupported platform"),
+        ("git@github.com:microsoft/vscode.git", "Unsupported platform"),
+    ])
+    def test_parse_repository_url_errors(self, analyzer, url, message):
+        """Test parsing invalid URLs and unsupported platforms."""
+        with pytest.raises(ValueError, match=message):
+            analyzer._parse_repository_url(url)
     
     @pytest.mark.asyncio
-    async def test_analyze_basic(self, analyzer, mock_github_api):
+    async def test_analyze_basic(self, analyzer, sample_repo_info, sample_contributors):
         """Test basic repository analysis."""
-        with patch.object(analyzer, '_get_repository_info') as mock_repo_info, \
-             patch.object(analyzer, '_get_contributors') as mock_contributors, \
-             patch.object(analyzer, '_get_languages') as mock_languages:
-            
-            # Setup mocks
-            mock_repo_info.return_value = RepositoryInfo(
-                name="test-repo",
-                owner="testuser",
-                full_name="testuser/test-repo",
-                description="Test repository",
-                primary_language="Python",
-                languages={},
-                stars=50,
-                forks=10,
-                watchers=45,
-                size_kb=1024,
-                created_at="2020-01-01T00:00:00Z",
-                updated_at="2024-01-01T00:00:00Z",
-                pushed_at="2024-01-01T00:00:00Z",
-                is_fork=False,
-                is_archived=False,
-                is_private=False,
-                default_branch="main",
-                topics=["python", "testing"],
-                license_name="MIT",
-                homepage=None
-            )
-            
-            mock_contributors.return_value = [
-                ContributorInfo(
-                    login="testuser",
-                    id=12345,
-                    type="User",
-                    contributions=50,
-                    avatar_url="https://github.com/images/testuser",
-                    profile_url="https://github.com/testuser"
-                )
-            ]
-            
-            mock_languages.return_value = {"Python": 75.0, "JavaScript": 25.0}
-            
+        with patch.multiple(
+            analyzer,
+            # Stand-in session so analyze() does not open a real aiohttp one
+            session=MagicMock(),
+            _get_repository_info=AsyncMock(return_value=sample_repo_info),
+            _get_contributors=AsyncMock(return_value=sample_contributors),
+            _get_languages=AsyncMock(return_value={"Python": 75.0, "JavaScript": 25.0})
+        ):
             # Perform analysis
             result = await analyzer.analyze(
                 "https://github.com/testuser/test-repo",
@@ -0,0 +1,582 @@
+"""
+Test suite for GitOSINT-MCP server analyzer
+"""
+
+import pytest
+import pytest_asyncio
+import json
+import httpx
+from dataclasses import asdict
+from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from typing import Final
+
+from src.gitosint_mcp.server import (
+    GitOSINTAnalyzer,
+    UserIntelligence,
+    RepositoryIntel
+)
+
+
+# GitHub repository API response
+GITHUB_REPO_RESPONSE: Final = {
+    "name": "test-repo",
+    "full_name": "testuser/test-repo",
+    "description": "A test repository for OSINT analysis",
+    "stargazers_count": 150,
+    "forks_count": 30,
+    "language": "Python",
+    "topics": ["osint", "python", "security"],
+    "has_security_policy": True,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-12-01T00:00:00Z",
+    "default_branch": "main",
+    "size": 1024,
+    "open_issues_count": 5,
+    "subscribers_count": 20
+}
+
+# GitHub user API response
+GITHUB_USER_RESPONSE: Final = {
+    "login": "testuser",
+    "id": 123456,
+    "name": "Test User",
+    "email": "test@example.com",
+    "bio": "Security researcher and developer",
+    "location": "San Francisco, CA",
+    "company": "Test Security Corp",
+    "blog": "https://testuser.dev",
+    "twitter_username": "testuser",
+    "public_repos": 25,
+    "public_gists": 5,
+    "followers": 150,
+    "following": 75,
+    "created_at": "2020-01-01T00:00:00Z",
+    "updated_at": "2023-12-01T00:00:00Z",
+    "hireable": True
+}
+
+# GitHub contributors API response
+CONTRIBUTORS_RESPONSE: Final = [
+    {
+        "login": "contributor1",
+        "id": 111111,
+        "contributions": 50,
+        "email": "contrib1@example.com",
+        "type": "User"
+    },
+    {
+        "login": "contributor2", 
+        "id": 222222,
+        "contributions": 25,
+        "email": "contrib2@example.com",
+        "type": "User"
+    },
+    {
+        "login": "testuser",
+        "id": 123456,
+        "contributions": 100,
+        "email": "test@example.com",
+        "type": "User"
+    }
+]
+
+# GitHub commits API response
+COMMITS_RESPONSE: Final = [
+    {
+        "sha": "abc123",
+        "commit": {
+            "author": {
+                "name": "Test User",
+                "email": "test@example.com",
+                "date": "2023-12-01T10:00:00Z"
+            },
+            "committer": {
+                "name": "Test User", 
+                "email": "test@example.com",
+                "date": "2023-12-01T10:00:00Z"
+            },
+            "message": "Add new feature"
+        }
+    },
+    {
+        "sha": "def456",
+        "commit": {
+            "author": {
+                "name": "Contributor",
+                "email": "contrib@example.com",
+                "date": "2023-11-30T15:00:00Z"
+            },
+            "committer": {
+                "name": "Contributor",
+                "email": "contrib@example.com", 
+                "date": "2023-11-30T15:00:00Z"
+            },
+            "message": "Fix bug in analyzer"
+        }
+    }
+]
+
+# Malformed API body; both JSON decoders reject it with JSONDecodeError
+INVALID_JSON_BODY: Final = b"{not json"
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _fake_httpx():
+    """Give analyzers built in this module a lightweight stand-in HTTP client
+    
+    Only the server module's httpx reference is replaced; httpx itself is untouched.
+    """
+    def fake_client(**kwargs):
+        return Mock(headers=httpx.Headers(kwargs.get("headers")), get=AsyncMock(), aclose=AsyncMock())
+    
+    fake = Mock(side_effect=fake_client)
+    with patch("src.gitosint_mcp.server.httpx", SimpleNamespace(AsyncClient=fake)):
+        yield fake
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _fast_sleep():
+    """Make the analyzer's rate-limit sleeps return immediately
+    
+    The server module gets a stand-in asyncio namespace, so the real
+    asyncio.sleep used by the event loop and pytest-asyncio is untouched.
+    """
+    sleep = AsyncMock(return_value=None)
+    with patch("src.gitosint_mcp.server.asyncio", SimpleNamespace(sleep=sleep)):
+        yield sleep
+
+
+def _resp(status=200, payload=None, content=None, **overrides):
+    """Build a fake HTTP response; keyword overrides replace raise_for_status"""
+    if content is None:
+        content = json.dumps(payload).encode()
+    return SimpleNamespace(**{
+        "status_code": status,
+        "content": content,
+        "json": lambda: json.loads(content),
+        "raise_for_status": lambda: None,
+        **overrides,
+    })
+
+
+def _raises(exc):
+    """Build a response method override that raises exc when called"""
+    def method():
+        raise exc
+    return method
+
+
+class _StubClient:
+    """Minimal async HTTP client returning the response registered for each URL, else a 404"""
+    
+    def __init__(self, routes=None):
+        self.routes = routes or {}
+    
+    async def get(self, url, **kwargs):
+        response = self.routes.get(url)
+        return response if response is not None else _resp(404)
+    
+    async def aclose(self):
+        pass
+
+
+class TestGitOSINTAnalyzer:
+    """Test GitOSINTAnalyzer class"""
+    
+    @pytest.fixture(scope="module")
+    def analyzer(self, _fake_httpx):
+        """Create analyzer instance shared by the module"""
+        # The client comes from _fake_httpx, so there is nothing to close
+        return GitOSINTAnalyzer()
+    
+    @pytest_asyncio.fixture
+    async def github_api(self, analyzer):
+        """Route analyzer HTTP calls to canned API payloads keyed by URL path"""
+        routes = {}
+        
+        def handler(request):
+            status, payload = routes.get(request.url.path, (404, {"message": "Not Found"}))
+            return httpx.Response(status, json=payload)
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with patch.object(analyzer, 'client', client):
+                yield routes
+    
+    async def test_analyzer_initialization(self, analyzer):
+        """Test analyzer initialization"""
+        assert analyzer.client is not None
+        assert analyzer.rate_limit_delay == 1.0
+        assert "GitOSINT-MCP" in analyzer.client.headers["User-Agent"]
+    
+    async def test_analyze_github_repository_success(self, analyzer, github_api):
+        """Test successful GitHub repository analysis"""
+        github_api.update({
+            "/repos/testuser/test-repo": (200, GITHUB_REPO_RESPONSE),
+            "/repos/testuser/test-repo/contributors": (200, CONTRIBUTORS_RESPONSE),
+            "/repos/testuser/test-repo/languages": (200, {"Python": 10000, "JavaScript": 2000}),
+            "/repos/testuser/test-repo/stats/commit_activity": (200, [
+                {"total": 5, "week": 1670000000},
+                {"total": 10, "week": 1670604800},
+                {"total": 8, "week": 1671209600},
+                {"total": 12, "week": 1671814400}
+            ])
+        })
+        
+        result = await analyzer.analyze_repository("https://github.com/testuser/test-repo")
+        
+        expected = {
+            "name": "testuser/test-repo",
+            "description": "A test repository for OSINT analysis",
+            "stars": 150,
+            "forks": 30,
+            "language": "Python"
+        }
+        
+        assert isinstance(result, RepositoryIntel)
+        data = asdict(result)
+        assert {key: data[key] for key in expected} == expected
+        assert "osint" in data["topics"]
+        assert len(data["contributors"]) == 3
+    
+    async def test_analyze_repository_invalid_url(self, analyzer):
+        """Test repository analysis with invalid URL"""
+        with pytest.raises(ValueError, match="Invalid repository URL format"):
+            await analyzer.analyze_repository("https://github.com/invalid")
+        
+        with pytest.raises(ValueError, match="Invalid repository URL format"):
+            await analyzer.analyze_repository("not-a-url")
+    
+    async def test_analyze_repository_unsupported_platform(self, analyzer):
+        """Test repository analysis with unsupported platform"""
+        with pytest.raises(ValueError, match="Unsupported platform"):
+            await analyzer.analyze_repository("https://bitbucket.org/user/repo")
+    
+    async def test_discover_github_user_success(self, analyzer, github_api):
+        """Test successful GitHub user discovery"""
+        mock_repos_response = [
+            {
+                "name": "repo1",
+                "stargazers_count": 10,
+                "language": "Python",
+                "updated_at": "2023-12-01T00:00:00Z"
+            },
+            {
+                "name": "repo2", 
+                "stargazers_count": 5,
+                "language": "JavaScript",
+                "updated_at": "2023-11-15T00:00:00Z"
+            }
+        ]
+        
+        github_api.update({
+            "/users/testuser": (200, GITHUB_USER_RESPONSE),
+            "/users/testuser/repos": (200, mock_repos_response)
+        })
+        
+        # Mock email extraction and social connections
+        with patch.multiple(
+            analyzer,
+            _extract_emails_from_repos=AsyncMock(return_value=['test@example.com', 'work@company.com']),
+            _find_social_connections=AsyncMock(return_value=['friend1', 'friend2'])
+        ):
+            result = await analyzer.discover_user_info("testuser", "github")
+        
+        assert isinstance(result, UserIntelligence)
+        assert result.username == "testuser"
+        assert result.profile_data["name"] == "Test User"
+        assert result.profile_data["company"] == "Test Security Corp"
+        assert result.profile_data["location"] == "San Francisco, CA"
+        assert len(result.repositories) == 2
+        assert "Python" in result.languages
+        assert "JavaScript" in result.languages
+        assert len(result.email_addresses) == 2
+    
+    async def test_discover_user_invalid_platform(self, analyzer):
+        """Test user discovery with invalid platform"""
+        with pytest.raises(ValueError, match="Unsupported platform"):
+            await analyzer.discover_user_info("testuser", "invalid_platform")
+    
+    async def test_find_emails_user_search(self, analyzer):
+        """Test email discovery for user"""
+        mock_user_intel = UserIntelligence(
+            username="testuser",
+            email_addresses=["user@example.com", "user@company.com"],
+            repositories=[],
+            commit_count=0,
+            languages=[],
+            activity_pattern={},
+            social_connections=[],
+            profile_data={}
+        )
+        
+        with patch.object(analyzer, 'discover_user_info', return_value=mock_user_intel):
+            result = await analyzer.find_emails("testuser", "user")
+            
+            assert "user@example.com" in result
+            assert "user@company.com" in result
+            assert len(result) == 2
+    
+    async def test_find_emails_repo_search(self, analyzer):
+        """Test email discovery for repository"""
+        mock_repo_intel = RepositoryIntel(
+            name="test/repo",
+            description="Test repo",
+            stars=0,
+            forks=0,
+            language="Python",
+            topics=[],
+            contributors=[
+                {"login": "user1", "email": "user1@example.com"},
+                {"login": "user2", "email": "user2@example.com"}
+            ],
+            commit_activity={},
+            security_issues=[],
+            dependencies=list({})
+        )
+        
+        with patch.object(analyzer, 'analyze_repository', return_value=mock_repo_intel):
+            result = await analyzer.find_emails("https://github.com/test/repo", "repo")
+            
+            assert "user1@example.com" in result
+            assert "user2@example.com" in result
+    
+    async def test_map_social_network(self, analyzer):
+        """Test social network mapping"""
+        mock_user_intel = UserIntelligence(
+            username="testuser",
+            email_addresses=[],
+            repositories=[
+                {"name": "repo1"},
+                {"name": "repo2"}
+            ],
+            commit_count=2,
+            languages=[],
+            activity_pattern={},
+            social_connections=[],
+            profile_data={}
+        )
+        
+        mock_repo_intel = RepositoryIntel(
+            name="repo1",
+            description="Test repo",
+            stars=0,
+            forks=0,
+            language="Python",
+            topics=[],
+            contributors=[
+                {"login": "collaborator1", "contributions": 15},
+                {"login": "collaborator2", "contributions": 8}
+            ],
+            commit_activity={},
+            security_issues=[],
+            dependencies=list({})
+        )
+        
+        with patch.multiple(
+            analyzer,
+            discover_user_info=AsyncMock(return_value=mock_user_intel),
+            analyze_repository=AsyncMock(return_value=mock_repo_intel)
+        ):
+            result = await analyzer.map_social_network("testuser", depth=2)
+            
+            assert result["center"] == "testuser"
+            assert result["depth"] == 2
+            assert "repo1" in result["connections"]
+            assert result["total_connections"] > 0
+    
+    async def test_scan_security_issues(self, analyzer):
+        """Test security issue scanning"""
+        mock_repo_intel = RepositoryIntel(
+            name="test/repo",
+            description="Repository with passwords and secret keys exposed",
+            stars=5,
+            forks=1,
+            language="Python",
+            topics=["security", "vulnerability"],
+            contributors=[],
+            commit_activity={"recent_activity": 0},
+            security_issues=[],
+            dependencies=["crypto-mining-tool", "bitcoin-miner", "normal-lib"]
+        )
+        
+        with patch.object(analyzer, 'analyze_repository', return_value=mock_repo_intel):
+            result = await analyzer.scan_security_issues("https://github.com/test/repo")
+            
+            # Should detect multiple security issues
+            assert len(result) > 0
+            
+            issue_types = [issue['type'] for issue in result]
+            assert 'potential_secret_exposure' in issue_types
+            assert 'suspicious_dependency' in issue_types
+            assert 'inactive_repository' in issue_types
+            
+            # Check severity levels
+            severities = [issue['severity'] for issue in result]
+            assert 'high' in severities or 'medium' in severities
+    
+    async def test_process_commit_activity(self, analyzer):
+        """Test commit activity processing"""
+        activity_data = [
+            {"total": 7, "week": 1669395200},
+            {"total": 5, "week": 1670000000},
+            {"total": 10, "week": 1670604800},
+            {"total": 3, "week": 1671209600},
+            {"total": 8, "week": 1671814400}
+        ]
+        
+        result = analyzer._process_commit_activity(activity_data)
+        
+        assert result["total_commits"] == 33
+        assert result["recent_activity"] == 26  # Last 4 weeks
+        assert result["peak_week"] == 10
+    
+    async def test_process_commit_activity_empty(self, analyzer):
+        """Test commit activity processing with empty data"""
+        result = analyzer._process_commit_activity([])
+        
+        assert result["total_commits"] == 0
+        assert result["recent_activity"] == 0
+        assert result["peak_week"] == 0
+    
+    def test_extract_languages(self, analyzer):
+        """Test language extraction from repositories"""
+        repos_data = [
+            {"language": "Python"},
+            {"language": "JavaScript"},
+            {"language": "Python"},  # Duplicate
+            {"language": None},  # No language
+            {"language": "Go"}
+        ]
+        
+        result = analyzer._extract_languages(repos_data)
+        
+        assert "Python" in result
+        assert "JavaScript" in result
+        assert "Go" in result
+        assert len(result) == 3  # Duplicates and None removed
+    
+    def test_analyze_activity_pattern(self, analyzer):
+        """Test activity pattern analysis"""
+        repos_data = [
+            {
+                "created_at": "2022-01-01T00:00:00Z",
+                "updated_at": "2023-12-01T00:00:00Z"
+            },
+            {
+                "created_at": "2022-06-01T00:00:00Z", 
+                "updated_at": "2023-11-15T00:00:00Z"
+            },
+            {
+                "created_at": "2023-01-01T00:00:00Z",
+                "updated_at": "2023-10-01T00:00:00Z"
+            }
+        ]
+        
+        result = analyzer._analyze_activity_pattern(repos_data)
+        
+        assert result["total_repositories"] == 3
+        assert "2022-01-01T00:00:00Z to 2023-01-01T00:00:00Z" in result["creation_span"]
+        assert result["last_activity"] == "2023-12-01T00:00:00Z"
+        assert result["active_repositories"] == 3
+    
+    async def test_extract_emails_from_repos(self, analyzer, github_api):
+        """Test email extraction from repository commits"""
+        github_api["/repos/testuser/test-repo/commits"] = (200, COMMITS_RESPONSE)
+        
+        repos = [{"name": "test-repo"}]
+        result = await analyzer._extract_emails_from_repos("testuser", repos)
+        
+        assert "test@example.com" in result
+        assert "contrib@example.com" in result
+        assert len(result) >= 2
+    
+    async def test_check_security_indicators(self, analyzer):
+        """Test security indicators detection"""
+        repo_data = {
+            "topics": ["security", "vulnerability", "exploit"],
+            "has_security_policy": True
+        }
+        
+        result = await analyzer._check_security_indicators(repo_data)
+        
+        assert len(result) >= 3  # Should detect security topics and policy
+        assert any("security" in indicator.lower() for indicator in result)
+        assert any("vulnerability" in indicator.lower() for indicator in result)
+        assert any("security policy" in indicator.lower() for indicator in result)
+    
+    async def test_find_social_connections(self, analyzer, github_api):
+        """Test finding social connections"""
+        github_api["/users/testuser/following"] = (200, [
+            {"login": "friend1"},
+            {"login": "friend2"},
+            {"login": "colleague1"}
+        ])
+        
+        result = await analyzer._find_social_connections("testuser")
+        
+        assert "friend1" in result
+        assert "friend2" in result
+        assert "colleague1" in result
+        assert len(result) <= 20  # Should be limited to 20
+    
+    async def test_analyzer_close(self, analyzer):
+        """Test analyzer cleanup"""
+        # Swap in a mock client so the shared one stays open
+        with patch.object(analyzer, 'client', new=Mock(aclose=AsyncMock())):
+            await analyzer.close()
+            analyzer.client.aclose.assert_called_once()
+
+
+class TestErrorHandling:
+    """Test error handling and edge cases"""
+    
+    @pytest.fixture(scope="module")
+    def analyzer_with_mock_client(self, _fake_httpx):
+        """Create analyzer with a stub client for error testing, shared by the module"""
+        analyzer = GitOSINTAnalyzer()
+        analyzer.client = _StubClient()
+        return analyzer
+    
+    async def test_http_error_handling(self, analyzer_with_mock_client):
+        """Test HTTP error handling"""
+        analyzer = analyzer_with_mock_client
+        
+        # Mock HTTP 404 error
+        url = "https://api.github.com/repos/nonexistent/repo"
+        error = httpx.HTTPStatusError("404 Not Found", request=httpx.Request("GET", url), response=httpx.Response(404))
+        analyzer.client.routes = {url: _resp(404, raise_for_status=_raises(error))}
+        
+        with pytest.raises(httpx.HTTPStatusError, match="404"):
+            await analyzer.analyze_repository("https://github.com/nonexistent/repo")
+    
+    async def test_rate_limiting_delay(self, analyzer_with_mock_client, _fast_sleep):
+        """Test that rate limiting delay is applied"""
+        analyzer = analyzer_with_mock_client
+        
+        # Only the repository lookup must succeed; every field falls back to a default
+        analyzer.client.routes = {"https://api.github.com/repos/user/repo": _resp(200, {})}
+        
+        # The stand-in sleep is shared by the module, so only count calls from here on
+        _fast_sleep.reset_mock()
+        await analyzer._analyze_github_repo("user", "repo")
+        _fast_sleep.assert_awaited_once_with(analyzer.rate_limit_delay)
+    
+    @pytest.mark.parametrize("fast_json", [True, False], ids=["orjson", "stdlib"])
+    async def test_invalid_json_response(self, analyzer_with_mock_client, fast_json, monkeypatch):
+        """Test handling of invalid JSON responses with either decoder"""
+        analyzer = analyzer_with_mock_client
+        if fast_json:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("src.gitosint_mcp.server._json_fast", None)
+        
+        mock_response = _resp(content=INVALID_JSON_BODY)
+        analyzer.client.routes = {"https://api.github.com/repos/user/repo": mock_response}
+        
+        with pytest.raises(json.JSONDecodeError):
+            await analyzer._analyze_github_repo("user", "repo")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Test suite for GitOSINT-MCP server MCP handler functions
+"""
+
+import pytest
+import json
+from unittest.mock import AsyncMock, patch
+from typing import Final
+
+from src.gitosint_mcp.server import (
+    UserIntelligence,
+    RepositoryIntel,
+    handle_list_tools,
+    handle_call_tool
+)
+
+
+# Security scan findings returned by the mocked analyzer
+SECURITY_ISSUES: Final = [
+    {"type": "potential_secret_exposure", "severity": "high", "description": "Secrets found"},
+    {"type": "suspicious_dependency", "severity": "medium", "description": "Crypto mining lib"},
+    {"type": "inactive_repository", "severity": "low", "description": "No recent activity"}
+]
+
+
+def _payload(result):
+    """Decode the JSON payload of a single-item tool call result"""
+    return json.loads(result[0].text)
+
+
+class TestMCPServerFunctions:
+    """Test MCP server handler functions"""
+    
+    async def test_handle_list_tools(self):
+        """Test listing available tools"""
+        tools = await handle_list_tools()
+        
+        assert len(tools) == 5
+        tool_names = [tool.name for tool in tools]
+        
+        expected_tools = [
+            "analyze_repository",
+            "discover_user_info", 
+            "find_emails",
+            "map_social_network",
+            "scan_security_issues"
+        ]
+        
+        for expected_tool in expected_tools:
+            assert expected_tool in tool_names
+        
+        # Check that tools have proper schemas
+        for tool in tools:
+            assert hasattr(tool, 'inputSchema')
+            assert 'type' in tool.inputSchema
+            assert 'properties' in tool.inputSchema
+            assert 'required' in tool.inputSchema
+    
+    @pytest.mark.parametrize("tool_name,arguments,mock_attr,mock_value,expected", [
+        pytest.param(
+            "analyze_repository",
+            {"repo_url": "https://github.com/test/repo"},
+            "analyze_repository",
+            RepositoryIntel(
+                name="test/repo",
+                description="Test repository",
+                stars=100,
+                forks=25,
+                language="Python",
+                topics=["test", "automation"],
+                contributors=[{"login": "user1"}],
+                commit_activity={"recent_activity": 10},
+                security_issues=["issue1"],
+                dependencies=["Python"]
+            ),
+            {"name": "test/repo", "stars": 100, "language": "Python"},
+            id="analyze_repository"
+        ),
+        pytest.param(
+            "discover_user_info",
+            {"username": "testuser", "platform": "github"},
+            "discover_user_info",
+            UserIntelligence(
+                username="testuser",
+                email_addresses=["test@example.com"],
+                repositories=[{"name": "repo1"}],
+                commit_count=10,
+                languages=["Python", "JavaScript"],
+                activity_pattern={"total_repos": 1},
+                social_connections=["friend1"],
+                profile_data={"name": "Test User", "company": "Test Corp"}
+            ),
+            {"username": "testuser", "email_addresses": ["test@example.com"], "languages": ["Python", "JavaScript"]},
+            id="discover_user_info"
+        ),
+        pytest.param(
+            "find_emails",
+            {"target": "testuser", "search_type": "user"},
+            "find_emails",
+            ["user@example.com", "user@company.com", "user@personal.com"],
+            {"emails": ["user@example.com", "user@company.com", "user@personal.com"], "count": 3},
+            id="find_emails"
+        ),
+        pytest.param(
+            "map_social_network",
+            {"username": "testuser", "depth": 2},
+            "map_social_network",
+            {
+                "center": "testuser",
+                "depth": 2,
+                "total_connections": 5,
+                "connections": {
+                    "repo1": [{"username": "friend1", "contributions": 10}]
+                }
+            },
+            {"center": "testuser", "depth": 2, "total_connections": 5},
+            id="map_social_network"
+        ),
+        pytest.param(
+            "scan_security_issues",
+            {"repo_url": "https://github.com/test/repo"},
+            "scan_security_issues",
+            SECURITY_ISSUES,
+            {"security_issues": SECURITY_ISSUES, "count": 3},
+            id="scan_security_issues"
+        ),
+    ])
+    async def test_handle_call_tool(self, tool_name, arguments, mock_attr, mock_value, expected):
+        """Test each tool call is dispatched to the analyzer and serialized"""
+        with patch(f'src.gitosint_mcp.server.analyzer.{mock_attr}', AsyncMock(return_value=mock_value)):
+            result = await handle_call_tool(tool_name, arguments)
+        
+        assert len(result) == 1
+        assert result[0].type == "text"
+        
+        data = _payload(result)
+        assert {key: data.get(key) for key in expected} == expected
+    
+    async def test_handle_call_tool_unknown_tool(self):
+        """Test calling unknown tool"""
+        result = await handle_call_tool("unknown_tool", {})
+        
+        assert len(result) == 1
+        assert result[0].type == "text"
+        
+        data = _payload(result)
+        assert "error" in data
+        assert data["code"] == "UNKNOWN_TOOL"
+    
+    async def test_handle_call_tool_missing_arguments(self):
+        """Test calling tool with missing required arguments"""
+        result = await handle_call_tool("analyze_repository", {})
+        
+        assert len(result) == 1
+        assert result[0].type == "text"
+        
+        data = _payload(result)
+        assert "error" in data
+        assert data["code"] == "MISSING_ARGUMENT"
+    
+    async def test_handle_call_tool_exception_handling(self):
+        """Test tool call exception handling"""
+        with patch('src.gitosint_mcp.server.analyzer') as mock_analyzer:
+            mock_analyzer.analyze_repository.side_effect = Exception("Test error")
+            
+            result = await handle_call_tool(
+                "analyze_repository",
+                {"repo_url": "https://github.com/test/repo"}
+            )
+            
+            assert len(result) == 1
+            assert result[0].type == "text"
+            
+            data = _payload(result)
+            assert "error" in data
+            assert "Test error" in data["error"]
+            assert data["code"] == "TOOL_EXECUTION_FAILED"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])